@@ -63,10 +63,25 @@ class ContextRetriever:
         slice_dir: Optional[Path] = entry.get("slice_dir")
         result: dict = {"classes": [], "functions": []}
         if slice_dir:
-            for key, fname in [("classes", "classes.json"), ("functions", "functions.json")]:
-                sym_path = slice_dir / "symbols" / fname
-                if sym_path.exists():
-                    result[key] = json.loads(sym_path.read_text())
+            symbols_jsonl = slice_dir / "symbols.jsonl"
+            if symbols_jsonl.exists():
+                with open(symbols_jsonl, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        row = json.loads(line)
+                        record_type = row.pop("record_type", "")
+                        if record_type == "class":
+                            result["classes"].append(row)
+                        elif record_type == "function":
+                            result["functions"].append(row)
+            else:
+                # Legacy layout: one JSON file per symbol kind under symbols/
+                for key, fname in [("classes", "classes.json"), ("functions", "functions.json")]:
+                    sym_path = slice_dir / "symbols" / fname
+                    if sym_path.exists():
+                        result[key] = json.loads(sym_path.read_text())
         self._symbol_cache[cache_key] = result
         return result
 
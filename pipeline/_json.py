@@ -0,0 +1,41 @@
+"""orjson-backed JSON helpers shared by pipeline output stages."""
+
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+
+def dump(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Serialize *obj* to *path* as 2-space-indented UTF-8 JSON.
+
+    orjson encodes in native code and emits bytes directly, avoiding the
+    pure-Python encoder and the str -> bytes round trip of ``json.dump``.
+    Unknown types fall back to ``str()``, matching the ``default=str``
+    convention used by the old stdlib writes.
+    """
+    Path(path).write_bytes(
+        orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    )
+
+
+def dump_jsonl(rows: Any, path: Union[str, Path]) -> None:
+    """
+    Write an iterable of JSON-serializable rows to *path* as JSON Lines.
+
+    One file handle, sequential appends - no per-record file creation.
+    """
+    with open(path, "wb") as f:
+        for row in rows:
+            f.write(orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS, default=str))
+            f.write(b"\n")
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Deserialize JSON from *path*."""
+    return orjson.loads(Path(path).read_bytes())
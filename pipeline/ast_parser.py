@@ -2,8 +2,10 @@
 
 import logging
 import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import tree_sitter
 from tree_sitter import Language, Parser
 
@@ -11,6 +13,15 @@ logger = logging.getLogger(__name__)
 
 _languages = {}
 
+# Parsed QA payloads keyed by (file path, content hash). Consecutive slices
+# share the vast majority of blobs, so after the first slice only changed
+# files pay the tree-sitter parse cost. Per-process, like _languages.
+_qa_parse_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# How many file contents the serial parse path keeps prefetched; bounds
+# memory while keeping the reader thread ahead of the parser
+_READ_AHEAD_DEPTH = 32
+
 
 def _load_language(lang_name: str) -> Optional[Language]:
     """
@@ -236,11 +247,26 @@ def calculate_content_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def _read_file_bytes(file_path: str) -> Optional[bytes]:
+    """Read a file's bytes, logging and returning None on failure."""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.warning(f"File not found: {file_path}")
+        return None
+    except OSError as e:
+        logger.warning(f"Error reading file {file_path}: {e}")
+        return None
+
+
 def parse_slice_files(
     repo_path: str,
     slice_commit_hash: str,
     config_extensions: Dict[str, List[str]],
-    timeout_seconds: int = 30
+    timeout_seconds: int = 30,
+    jobs: int = 1,
+    checkout: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Parse all source files in a repository at a specific commit.
@@ -253,12 +279,15 @@ def parse_slice_files(
         slice_commit_hash: Commit hash to checkout
         config_extensions: Language to extension mapping
         timeout_seconds: Parsing timeout
+        jobs: Parallel worker processes for per-file parsing
+        checkout: Checkout the slice commit (False if the caller already did)
 
     Returns:
         List of QA-enriched parsed file information
     """
     return parse_slice_files_for_qa(
-        repo_path, slice_commit_hash, config_extensions, timeout_seconds
+        repo_path, slice_commit_hash, config_extensions, timeout_seconds, jobs,
+        checkout
     )
 
 
@@ -294,7 +323,8 @@ def _should_traverse_node_qa(node_type: str, language: str) -> bool:
 def parse_file_for_qa(
     file_path: str,
     language: str,
-    timeout_seconds: int = 30
+    timeout_seconds: int = 30,
+    content: Optional[bytes] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Parse a source code file and extract QA-enriched metadata.
@@ -307,6 +337,8 @@ def parse_file_for_qa(
         file_path: Path to source file
         language: Programming language
         timeout_seconds: Timeout for parsing
+        content: File bytes already read by the caller; when provided the
+            file is not opened again
 
     Returns:
         Dictionary containing QA-enriched data:
@@ -322,17 +354,18 @@ def parse_file_for_qa(
         Returns None if error
     """
     try:
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
-            logger.warning(f"File not found: {file_path}")
-            return None
-
-        with open(file_path, 'rb') as f:
-            content = f.read()
+        if content is None:
+            content = _read_file_bytes(file_path)
 
         if not content:
             return None
 
+        content_hash = calculate_content_hash(content)
+        cache_key = (file_path, content_hash)
+        cached = _qa_parse_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         lang = _load_language(language)
         if not lang:
             return None
@@ -340,13 +373,11 @@ def parse_file_for_qa(
         parser = Parser(lang)
         tree = parser.parse(content)
 
-        functions = _extract_functions_for_qa(tree, content, language, file_path)
-        classes = _extract_classes_for_qa(tree, content, language, file_path)
+        functions, classes = _extract_symbols_for_qa(tree, content, language, file_path)
         imports = _extract_imports(tree, content, language)
         module_doc = _extract_module_doc(tree, content, language)
-        content_hash = calculate_content_hash(content)
 
-        return {
+        result = {
             "file_path": file_path,
             "content_hash": content_hash,
             "language": language,
@@ -355,35 +386,49 @@ def parse_file_for_qa(
             "imports": imports,
             "module_doc": module_doc
         }
+        _qa_parse_cache[cache_key] = result
+        return result
 
     except Exception as e:
         logger.warning(f"Error parsing file for QA {file_path}: {e}")
         return None
 
 
-def _extract_functions_for_qa(
+def _extract_symbols_for_qa(
     tree: tree_sitter.Tree,
     content: bytes,
     language: str,
     file_path: str
-) -> List[Dict[str, Any]]:
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    Extract QA-enriched function symbols from AST.
-    Includes parameter types, return types, decorators, and inline docstrings.
+    Extract QA-enriched function and class symbols in a single AST traversal.
+    Functions include parameter types, return types, decorators, and inline
+    docstrings; classes include fields, method lists, and docstrings.
+    One combined walk replaces the previous separate function/class passes.
     """
     functions = []
+    classes = []
 
     function_types = {
         "python": ["function_definition"],
         "java": ["method_declaration", "constructor_declaration"]
     }
-    target_types = function_types.get(language, [])
+    class_types = {
+        "python": ["class_definition"],
+        "java": ["class_declaration", "interface_declaration"]
+    }
+    function_targets = function_types.get(language, [])
+    class_targets = class_types.get(language, [])
 
     def traverse(node: tree_sitter.Node, container: Optional[str] = None):
-        if node.type in target_types:
+        if node.type in function_targets:
             func_info = _extract_function_symbol_qa(node, language, content, container, file_path)
             if func_info:
                 functions.append(func_info)
+        elif node.type in class_targets:
+            class_info = _extract_class_symbol_qa(node, language, content, file_path)
+            if class_info:
+                classes.append(class_info)
 
         current_container = container
         if language == "python" and node.type == "class_definition":
@@ -402,7 +447,7 @@ def _extract_functions_for_qa(
                 traverse(child, current_container)
 
     traverse(tree.root_node)
-    return functions
+    return functions, classes
 
 
 def _extract_function_symbol_qa(
@@ -881,38 +926,6 @@ def _extract_decorators(
     return decorators
 
 
-def _extract_classes_for_qa(
-    tree: tree_sitter.Tree,
-    content: bytes,
-    language: str,
-    file_path: str
-) -> List[Dict[str, Any]]:
-    """
-    Extract QA-enriched class/interface symbols from AST.
-    Includes fields, method list, decorators, and docstrings.
-    """
-    classes = []
-
-    class_types = {
-        "python": ["class_definition"],
-        "java": ["class_declaration", "interface_declaration"]
-    }
-    target_types = class_types.get(language, [])
-
-    def traverse(node: tree_sitter.Node):
-        if node.type in target_types:
-            class_info = _extract_class_symbol_qa(node, language, content, file_path)
-            if class_info:
-                classes.append(class_info)
-
-        for child in node.children:
-            if _should_traverse_node_qa(child.type, language):
-                traverse(child)
-
-    traverse(tree.root_node)
-    return classes
-
-
 def _extract_class_symbol_qa(
     node: tree_sitter.Node,
     language: str,
@@ -1489,21 +1502,37 @@ def _extract_module_doc(
     return None
 
 
+def _parse_file_task(args: Tuple[str, str, int]) -> Optional[Dict[str, Any]]:
+    """Picklable single-argument wrapper so parse_file_for_qa can run in a pool."""
+    file_path, language, timeout_seconds = args
+    return parse_file_for_qa(file_path, language, timeout_seconds)
+
+
 def parse_slice_files_for_qa(
     repo_path: str,
     slice_commit_hash: str,
     config_extensions: Dict[str, List[str]],
-    timeout_seconds: int = 30
+    timeout_seconds: int = 30,
+    jobs: int = 1,
+    checkout: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Parse all source files at a specific commit using QA-enriched extraction.
     Similar to parse_slice_files() but uses parse_file_for_qa().
 
+    With ``jobs > 1`` the per-file parsing (pure-CPU tree-sitter work) is
+    fanned out over a ProcessPoolExecutor; a generous chunksize amortizes
+    the pickling cost of the small task tuples.
+
     Args:
         repo_path: Path to repository
         slice_commit_hash: Commit hash to checkout
         config_extensions: Language to extension mapping
         timeout_seconds: Parsing timeout
+        jobs: Parallel worker processes for per-file parsing
+        checkout: Checkout the slice commit and restore the original ref
+            afterwards. Pass False when the caller already has repo_path
+            (e.g. a dedicated worktree) positioned at the slice commit.
 
     Returns:
         List of QA-enriched parsed file information
@@ -1518,29 +1547,42 @@ def parse_slice_files_for_qa(
     try:
         repo = Repo(repo_path)
 
-        if repo.head.is_detached:
-            original_ref = repo.head.commit.hexsha
-        else:
-            original_ref = repo.active_branch.name
-
-        # Retry checkout on EAGAIN (errno 35 on macOS / errno 11 on Linux)
-        for attempt in range(3):
-            try:
-                repo.git.checkout(slice_commit_hash)
-                break
-            except Exception as e:
-                cause = getattr(e, 'errno', None) or (getattr(e, '__cause__', None) and getattr(e.__cause__, 'errno', None))
-                if cause == errno.EAGAIN and attempt < 2:
-                    logger.warning(f"EAGAIN on checkout (attempt {attempt+1}/3), retrying in 2s...")
-                    time.sleep(2)
-                else:
-                    raise
-
-        source_files = []
-        for ext_list in config_extensions.values():
-            for ext in ext_list:
-                source_files.extend(Path(repo_path).rglob(f"*{ext}"))
+        original_ref = None
+        if checkout:
+            if repo.head.is_detached:
+                original_ref = repo.head.commit.hexsha
+            else:
+                original_ref = repo.active_branch.name
 
+            # Retry checkout on EAGAIN (errno 35 on macOS / errno 11 on Linux)
+            for attempt in range(3):
+                try:
+                    repo.git.checkout(slice_commit_hash)
+                    break
+                except Exception as e:
+                    cause = getattr(e, 'errno', None) or (getattr(e, '__cause__', None) and getattr(e.__cause__, 'errno', None))
+                    if cause == errno.EAGAIN and attempt < 2:
+                        logger.warning(f"EAGAIN on checkout (attempt {attempt+1}/3), retrying in 2s...")
+                        time.sleep(2)
+                    else:
+                        raise
+
+        # Enumerate tracked files with a single `git ls-files` pipe instead of
+        # one Python rglob walk per extension; git streams the index natively
+        # and untracked artifacts are excluded for free.
+        extensions = {
+            ext.lower()
+            for ext_list in config_extensions.values()
+            for ext in ext_list
+        }
+        raw_listing = repo.git.ls_files("-z")
+        source_files = [
+            Path(repo_path) / rel_path
+            for rel_path in raw_listing.split("\0")
+            if rel_path and Path(rel_path).suffix.lower() in extensions
+        ]
+
+        tasks: List[Tuple[str, str, int]] = []
         for file_path in source_files:
             if any(part.startswith('.') for part in file_path.parts):
                 continue
@@ -1553,11 +1595,41 @@ def parse_slice_files_for_qa(
             if not language:
                 continue
 
-            qa_data = parse_file_for_qa(str(file_path), language, timeout_seconds)
-            if qa_data:
-                parsed_files.append(qa_data)
+            tasks.append((str(file_path), language, timeout_seconds))
+
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for qa_data in executor.map(_parse_file_task, tasks, chunksize=16):
+                    if qa_data:
+                        parsed_files.append(qa_data)
+        else:
+            # Serial parsing with a read-ahead thread: a single reader keeps
+            # a bounded window of file contents in flight so disk reads
+            # overlap tree-sitter CPU time instead of alternating with it.
+            with ThreadPoolExecutor(max_workers=1) as reader:
+                window: deque = deque()
+                task_iter = iter(tasks)
+
+                def _fill_window():
+                    while len(window) < _READ_AHEAD_DEPTH:
+                        try:
+                            task = next(task_iter)
+                        except StopIteration:
+                            return
+                        window.append((task, reader.submit(_read_file_bytes, task[0])))
+
+                _fill_window()
+                while window:
+                    (file_path_s, language, timeout), read_future = window.popleft()
+                    qa_data = parse_file_for_qa(
+                        file_path_s, language, timeout, content=read_future.result()
+                    )
+                    if qa_data:
+                        parsed_files.append(qa_data)
+                    _fill_window()
 
-        repo.git.checkout(original_ref)
+        if checkout and original_ref:
+            repo.git.checkout(original_ref)
 
     except OSError as e:
         if e.errno == errno.EAGAIN:
@@ -8,6 +8,14 @@ from git.exc import GitCommandError
 
 logger = logging.getLogger(__name__)
 
+# Release-tag patterns compiled once at import; parse_release_tag runs per
+# tag, so repeated re.sub/re.match calls would recompile (or at least
+# re-hash into the regex cache) on every invocation
+_VERSION_PREFIX_RE = re.compile(r'^[vV]')
+_RELEASE_PREFIX_RE = re.compile(r'^release[-_.]?', re.IGNORECASE)
+_RELEASE_SUFFIX_RE = re.compile(r'[-_.]?release$', re.IGNORECASE)
+_VERSION_RE = re.compile(r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
 
 def get_diff_between_refs(repo: Repo, old_ref: str, new_ref: str):
     try:
@@ -36,11 +44,11 @@ def parse_release_tag(tag_name: str) -> Tuple[Optional[Tuple[int, int, int]], st
     Returns:
         ``(version_tuple, "release")`` on success, or ``(None, "discard")``.
     """
-    cleaned = re.sub(r'^[vV]', '', tag_name)
-    cleaned = re.sub(r'^release[-_.]?', '', cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r'[-_.]?release$', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _VERSION_PREFIX_RE.sub('', tag_name)
+    cleaned = _RELEASE_PREFIX_RE.sub('', cleaned)
+    cleaned = _RELEASE_SUFFIX_RE.sub('', cleaned)
 
-    m = re.match(r'^(\d+)(?:\.(\d+))?(?:\.(\d+))?', cleaned)
+    m = _VERSION_RE.match(cleaned)
     if not m:
         return None, "discard"
 
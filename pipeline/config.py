@@ -48,6 +48,7 @@ class ParsingConfig(BaseModel):
     """Configuration for code parsing."""
     languages: List[str] = Field(default=["python", "java"])
     timeout_seconds: int = Field(default=30, description="Timeout for parsing operations")
+    jobs: int = Field(default=1, description="Parallel worker processes for per-file parsing (1 = serial)")
     supported_extensions: Dict[str, List[str]] = Field(
         default_factory=lambda: {
             "python": [".py"],
@@ -3,16 +3,20 @@
 import argparse
 import json
 import logging
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 
+from git import Repo
+
 from pipeline.config import load_config, get_default_config
 from pipeline.repository_cloner import clone_repository, validate_repository
 from pipeline.semantic_slicer import identify_slices
 from pipeline.metadata_generator import enrich_slice_with_files
 from pipeline.validation.slice_validator import validate_all_slices
-from pipeline.models import RepositoryDataset, RepositoryInfo
+from pipeline.models import RepositoryDataset, RepositoryInfo, SemanticSlice
 from pipeline.output_writer import save_repository_dataset
 from datetime import datetime
 
@@ -22,21 +26,178 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Worktree assigned to this enrichment worker process (set by the pool initializer)
+_worker_worktree = None
+
+
+def _init_enrichment_worker(worktree_queue, log_level: str, log_format: str) -> None:
+    """
+    Pool initializer: claim a dedicated worktree for this worker process and
+    reinitialize logging (child processes do not inherit configured handlers).
+    """
+    global _worker_worktree
+    _worker_worktree = worktree_queue.get()
+    logging.basicConfig(
+        level=getattr(logging, log_level, logging.INFO),
+        format=log_format
+    )
+
+
+def _enrich_slice_in_worktree(slice: SemanticSlice, config) -> SemanticSlice:
+    """
+    Enrich a single slice inside this worker's private worktree.
+
+    Each worker owns one worktree, so checkouts never contend on a shared
+    index. The worktree is reused across slices; `checkout --detach` only
+    touches files that differ between consecutive checkouts.
+    """
+    worktree_repo = Repo(_worker_worktree)
+    worktree_repo.git.checkout("--detach", slice.commit_hash)
+    return enrich_slice_with_files(slice, _worker_worktree, config, checkout=False)
+
+
+def _create_worktrees(repo_path: str, count: int, config) -> List[str]:
+    """
+    Eagerly create `count` detached worktrees for the repository under the
+    configured cache directory. Stale worktrees from previous runs are removed
+    first so `git worktree add` does not fail on leftover directories.
+    """
+    repo = Repo(repo_path)
+    repo_name = Path(repo_path).name
+    # Resolve to an absolute path: git runs with cwd inside the clone, so a
+    # relative cache_dir would land the worktrees inside the repository
+    worktrees_root = Path(config.storage.cache_dir).resolve() / "worktrees" / repo_name
+    worktrees_root.mkdir(parents=True, exist_ok=True)
+
+    try:
+        repo.git.worktree("prune")
+    except Exception as e:
+        logger.warning(f"git worktree prune failed: {e}")
+
+    paths = []
+    for i in range(count):
+        worktree_path = worktrees_root / f"w{i}"
+        if worktree_path.exists():
+            try:
+                repo.git.worktree("remove", "--force", str(worktree_path))
+            except Exception as e:
+                logger.warning(f"Failed to remove stale worktree {worktree_path}: {e}")
+        repo.git.worktree("add", "--detach", str(worktree_path), "HEAD")
+        paths.append(str(worktree_path))
+
+    return paths
+
+
+def _remove_worktrees(repo_path: str, worktree_paths: List[str]) -> None:
+    """Remove the worktrees created by _create_worktrees()."""
+    repo = Repo(repo_path)
+    for worktree_path in worktree_paths:
+        try:
+            repo.git.worktree("remove", "--force", worktree_path)
+        except Exception as e:
+            logger.warning(f"Failed to remove worktree {worktree_path}: {e}")
+
+
+def _enrich_slices_sequential(
+    slices: List[SemanticSlice],
+    repo_path: str,
+    config
+) -> List[SemanticSlice]:
+    """
+    Enrich slices one by one inside a single persistent worktree.
+
+    Reusing one detached worktree keeps the primary working tree untouched
+    and makes each checkout cost proportional to the diff between
+    consecutive slices instead of a full tree rewrite per slice.
+    """
+    worktree_paths = _create_worktrees(repo_path, 1, config)
+    worktree_path = worktree_paths[0]
+    worktree_repo = Repo(worktree_path)
+
+    enriched_slices = []
+    try:
+        for i, slice in enumerate(slices, 1):
+            logger.info(f"Processing slice {i}/{len(slices)}: {slice.slice_id}")
+            try:
+                worktree_repo.git.checkout("--detach", slice.commit_hash)
+                enriched = enrich_slice_with_files(
+                    slice, worktree_path, config, checkout=False
+                )
+                enriched_slices.append(enriched)
+            except Exception as e:
+                logger.error(f"Error enriching slice {slice.slice_id}: {e}")
+                continue
+    finally:
+        _remove_worktrees(repo_path, worktree_paths)
+
+    return enriched_slices
+
+
+def _enrich_slices_parallel(
+    slices: List[SemanticSlice],
+    repo_path: str,
+    config,
+    jobs: int
+) -> List[SemanticSlice]:
+    """
+    Enrich slices in parallel with one detached worktree per worker process.
+
+    Results are collected as they complete and returned in the original
+    slice order. Slices whose enrichment raises are logged and dropped,
+    matching the sequential path's behaviour.
+    """
+    worktree_paths = _create_worktrees(repo_path, jobs, config)
+    logger.info(f"Created {len(worktree_paths)} worktrees for {jobs} enrichment workers")
+
+    manager = multiprocessing.Manager()
+    worktree_queue = manager.Queue()
+    for path in worktree_paths:
+        worktree_queue.put(path)
+
+    enriched_by_index = {}
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_enrichment_worker,
+            initargs=(worktree_queue, config.logging.level, config.logging.format),
+        ) as executor:
+            futures = {
+                executor.submit(_enrich_slice_in_worktree, slice, config): i
+                for i, slice in enumerate(slices)
+            }
+            completed = 0
+            for future in as_completed(futures):
+                i = futures[future]
+                completed += 1
+                try:
+                    enriched_by_index[i] = future.result()
+                    logger.info(
+                        f"Enriched slice {completed}/{len(slices)}: {slices[i].slice_id}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error enriching slice {slices[i].slice_id}: {e}")
+    finally:
+        _remove_worktrees(repo_path, worktree_paths)
+
+    return [enriched_by_index[i] for i in sorted(enriched_by_index)]
+
 
 def process_repository(
     repo_url: str,
     config,
     output_dir: str,
-    existing_repo_action: str = "ask"
+    existing_repo_action: str = "ask",
+    jobs: int = 1
 ) -> bool:
     """
     Process a single repository end-to-end.
-    
+
     Args:
         repo_url: Repository URL
         config: Configuration object
         output_dir: Output directory for results
-        
+        jobs: Number of parallel enrichment workers (1 = sequential)
+
     Returns:
         True if successful, False otherwise
     """
@@ -69,15 +230,10 @@ def process_repository(
             return False
         
         logger.info(f"Enriching {len(slices)} slices with file information...")
-        enriched_slices = []
-        for i, slice in enumerate(slices, 1):
-            logger.info(f"Processing slice {i}/{len(slices)}: {slice.slice_id}")
-            try:
-                enriched = enrich_slice_with_files(slice, cloned_path, config)
-                enriched_slices.append(enriched)
-            except Exception as e:
-                logger.error(f"Error enriching slice {slice.slice_id}: {e}")
-                continue
+        if jobs > 1:
+            enriched_slices = _enrich_slices_parallel(slices, cloned_path, config, jobs)
+        else:
+            enriched_slices = _enrich_slices_sequential(slices, cloned_path, config)
         
         logger.info("Validating slices...")
         validation_results = validate_all_slices(enriched_slices, config.validation)
@@ -140,6 +296,12 @@ def main():
         default=None,
         help="When repository already exists locally: ask/update/skip (overrides config)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of parallel enrichment workers, each with its own git worktree"
+    )
     
     args = parser.parse_args()
     
@@ -165,7 +327,7 @@ def main():
     
     success_count = 0
     for repo_url in repo_urls:
-        if process_repository(repo_url, config, args.output_dir, existing_repo_action):
+        if process_repository(repo_url, config, args.output_dir, existing_repo_action, jobs=max(1, args.jobs)):
             success_count += 1
     
     logger.info(f"Processed {success_count}/{len(repo_urls)} repositories successfully")
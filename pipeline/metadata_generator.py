@@ -1,8 +1,9 @@
 """Enrich semantic slices with parsed file metadata."""
 
 import logging
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from git import Repo
 
 from pipeline.models import SemanticSlice, SliceMetadata, QACodeFile, QAFunctionSymbol, QAClassSymbol, QAImport
@@ -11,13 +12,58 @@ from pipeline.ast_parser import parse_slice_files, detect_language
 
 logger = logging.getLogger(__name__)
 
+# Read size for line counting; large buffers keep big files from degrading
+# into millions of small reads (same fix pghoard applied to its 16 KiB
+# tar copy buffer).
+_LINE_COUNT_BUFFER_SIZE = 2 * 1024 * 1024
+
+
+def _count_file_lines(path) -> int:
+    """
+    Count lines in a file by reading 2 MiB binary chunks.
+
+    Counts newline bytes plus a trailing partial line, matching the line
+    semantics of iterating a text-mode file handle.
+    """
+    lines = 0
+    last_byte = b"\n"
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_LINE_COUNT_BUFFER_SIZE)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    if last_byte != b"\n":
+        lines += 1
+    return lines
+
+
+def _iter_repository_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield regular-file entries under *root*, skipping `.git` whether it is
+    a directory (normal clone) or a gitdir-pointer file (linked worktree).
+
+    Uses os.scandir recursively: file-vs-dir type comes straight from the
+    directory entry (no extra stat syscall per path), unlike Path.rglob
+    which stats every entry through is_file().
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name == ".git":
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_repository_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
 
 def _calculate_repository_totals(repo_path: str) -> tuple[int, int]:
     """
     Calculate repository-wide totals for current checked out snapshot.
 
     Counts all regular files under repo root (excluding `.git`) and counts
-    text lines using utf-8 decoding with ignore errors.
+    lines via buffered binary reads (encoding-agnostic).
 
     Args:
         repo_path: Path to repository root
@@ -25,21 +71,14 @@ def _calculate_repository_totals(repo_path: str) -> tuple[int, int]:
     Returns:
         Tuple of (total_files, total_lines)
     """
-    repo_root = Path(repo_path)
     total_files = 0
     total_lines = 0
 
-    for path in repo_root.rglob("*"):
-        if not path.is_file():
-            continue
-        if ".git" in path.parts:
-            continue
-
+    for entry in _iter_repository_files(repo_path):
         total_files += 1
 
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                total_lines += sum(1 for _ in f)
+            total_lines += _count_file_lines(entry.path)
         except Exception:
             # Keep file count even if line counting fails
             continue
@@ -50,39 +89,55 @@ def _calculate_repository_totals(repo_path: str) -> tuple[int, int]:
 def enrich_slice_with_files(
     slice: SemanticSlice,
     repo_path: str,
-    config: Config
+    config: Config,
+    checkout: bool = True
 ) -> SemanticSlice:
     """
     Enrich a slice with parsed file information.
-    
+
     Args:
         slice: Semantic slice to enrich
         repo_path: Path to repository
         config: Configuration object
-        
+        checkout: Checkout the slice commit first. Pass False when repo_path
+            is a worktree already positioned at the slice commit; the
+            checkout and branch restore are skipped entirely.
+
     Returns:
         Enriched SemanticSlice
     """
     logger.info(f"Enriching slice {slice.slice_id} with file information")
-    
+
     try:
         repo = Repo(repo_path)
-        
-        original_branch = repo.active_branch.name if repo.head.is_valid() else None
-        repo.git.checkout(slice.commit_hash)
-        
+
+        original_branch = None
+        if checkout:
+            # Detached HEAD (e.g. a dedicated worktree) has no active branch to restore
+            if repo.head.is_valid() and not repo.head.is_detached:
+                original_branch = repo.active_branch.name
+            repo.git.checkout(slice.commit_hash)
+
+        # The tree is already positioned at the slice commit, so parsing
+        # must not checkout again (the old double checkout/restore made
+        # every slice pay two full tree updates)
         parsed_files = parse_slice_files(
             repo_path,
             slice.commit_hash,
             config.parsing.supported_extensions,
-            config.parsing.timeout_seconds
+            config.parsing.timeout_seconds,
+            jobs=config.parsing.jobs,
+            checkout=False
         )
         
         repo_total_files, repo_total_lines = _calculate_repository_totals(repo_path)
 
         code_files = []
         target_language_total_lines = 0
-        
+        total_functions = 0
+        total_classes = 0
+        languages: dict = {}
+
         for parsed_file in parsed_files:
             file_path = parsed_file["file_path"]
             language = parsed_file["language"]
@@ -121,23 +176,34 @@ def enrich_slice_with_files(
             )
             
             code_files.append(code_file)
-        
+
+            total_functions += len(functions)
+            total_classes += len(classes)
+            lang_key = language or "unknown"
+            languages[lang_key] = languages.get(lang_key, 0) + 1
+
         slice.files = code_files
-        
+
         # total_* = repository-wide totals
         # target_language_total_* = parsed language totals (e.g. python/java)
         slice.metadata.total_files = repo_total_files
         slice.metadata.total_lines = repo_total_lines
         slice.metadata.target_language_total_files = len(code_files)
         slice.metadata.target_language_total_lines = target_language_total_lines
+        # Summarize symbol counts now so downstream statistics never have to
+        # re-walk the (potentially huge) per-file symbol lists
+        slice.metadata.symbol_stats = {
+            "total_functions": total_functions,
+            "total_classes": total_classes,
+            "languages": languages,
+        }
         
         if original_branch:
             try:
                 repo.git.checkout(original_branch)
             except Exception:
                 repo.git.checkout('master')  # Fallback
-        else:
-            repo.git.checkout('master')
+        # Detached worktrees stay on the slice commit; there is nothing to restore
         
         logger.info(f"Enriched slice {slice.slice_id} with {len(code_files)} files")
         return slice
@@ -166,12 +232,22 @@ def calculate_slice_statistics(slice: SemanticSlice) -> dict:
         "total_lines": slice.metadata.total_lines,
         "target_language_total_lines": slice.metadata.target_language_total_lines
     }
-    
+
+    symbol_stats = slice.metadata.symbol_stats
+    if symbol_stats:
+        # Use the counts precomputed at enrichment time instead of
+        # re-walking every file's symbol lists
+        stats["total_functions"] = symbol_stats.get("total_functions", 0)
+        stats["total_classes"] = symbol_stats.get("total_classes", 0)
+        stats["languages"] = dict(symbol_stats.get("languages", {}))
+        return stats
+
+    # Fallback for slices enriched before symbol_stats existed
     for file in slice.files:
         stats["total_functions"] += len(file.functions)
         stats["total_classes"] += len(file.classes)
-        
+
         lang = file.language or "unknown"
         stats["languages"][lang] = stats["languages"].get(lang, 0) + 1
-    
+
     return stats
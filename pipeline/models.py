@@ -51,6 +51,10 @@ class SliceMetadata(BaseModel):
         default_factory=dict,
         description="Breakdown of how the slice score was computed"
     )
+    symbol_stats: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Precomputed symbol counts (total_functions, total_classes, languages)"
+    )
 
 
 class SemanticSlice(BaseModel):
@@ -1,10 +1,10 @@
 """Write repository slice datasets to disk."""
 
-import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Any
 
+from pipeline import _json
 from pipeline.models import RepositoryDataset, SemanticSlice
 
 logger = logging.getLogger(__name__)
@@ -21,11 +21,9 @@ def save_repository_dataset(dataset: RepositoryDataset, output_dir: Path) -> Non
     │   ├── slice_0001/
     │   │   ├── metadata.json      # Slice metadata
     │   │   ├── files.json         # File list and hashes
-    │   │   └── symbols/           # QA-enriched symbol data
-    │   │       ├── functions.json  # Typed params, decorators, doc, ...
-    │   │       ├── classes.json    # Fields, method list, doc, ...
-    │   │       ├── imports.json    # Import statements
-    │   │       └── module_docs.json # Module-level docstrings
+    │   │   └── symbols.jsonl      # QA-enriched symbol records, one per line,
+    │   │                          # tagged record_type: function | class |
+    │   │                          # import | module_doc
     │   └── slice_0002/
     │       └── ...
     └── summary.json               # Overall statistics
@@ -58,8 +56,7 @@ def save_repository_dataset(dataset: RepositoryDataset, output_dir: Path) -> Non
     }
     
     metadata_path = repo_output_dir / "metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, default=str, ensure_ascii=False)
+    _json.dump(metadata, metadata_path)
     logger.info(f"Saved metadata.json: {metadata_path}")
     
     for idx, slice in enumerate(dataset.slices, 1):
@@ -70,8 +67,7 @@ def save_repository_dataset(dataset: RepositoryDataset, output_dir: Path) -> Non
     
     summary = generate_summary(dataset)
     summary_path = repo_output_dir / "summary.json"
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, default=str, ensure_ascii=False)
+    _json.dump(summary, summary_path)
     logger.info(f"Saved summary.json: {summary_path}")
     
     logger.info(f"Successfully saved dataset for {repo_name}")
@@ -95,8 +91,7 @@ def _save_slice_data(slice: SemanticSlice, slice_dir: Path) -> None:
     }
     
     metadata_path = slice_dir / "metadata.json"
-    with open(metadata_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, default=str, ensure_ascii=False)
+    _json.dump(metadata, metadata_path)
     
     files_data = [
         {
@@ -108,56 +103,30 @@ def _save_slice_data(slice: SemanticSlice, slice_dir: Path) -> None:
     ]
     
     files_path = slice_dir / "files.json"
-    with open(files_path, 'w', encoding='utf-8') as f:
-        json.dump(files_data, f, indent=2, default=str, ensure_ascii=False)
-    
-    symbols_dir = slice_dir / "symbols"
-    symbols_dir.mkdir(parents=True, exist_ok=True)
-    
-    all_functions = []
-    all_classes = []
-    all_imports = []
-    module_docs = []
+    _json.dump(files_data, files_path)
     
+    # All symbol data goes into a single JSONL file per slice instead of
+    # four separate JSON files; `record_type` tags each line (the symbol
+    # payloads carry their own `kind` field, hence the distinct name)
+    _json.dump_jsonl(_iter_symbol_records(slice), slice_dir / "symbols.jsonl")
+
+
+def _iter_symbol_records(slice: SemanticSlice):
+    """Yield tagged symbol records for a slice's symbols.jsonl."""
     for file in slice.files:
         rel_path = file.path
-        
+
         for func in file.functions:
-            func_dict = func.model_dump()
-            func_dict["file_path"] = rel_path
-            all_functions.append(func_dict)
-        
+            yield {"record_type": "function", **func.model_dump(), "file_path": rel_path}
+
         for cls in file.classes:
-            cls_dict = cls.model_dump()
-            cls_dict["file_path"] = rel_path
-            all_classes.append(cls_dict)
-        
+            yield {"record_type": "class", **cls.model_dump(), "file_path": rel_path}
+
         for imp in file.imports:
-            imp_dict = imp.model_dump()
-            imp_dict["file_path"] = rel_path
-            all_imports.append(imp_dict)
-        
+            yield {"record_type": "import", **imp.model_dump(), "file_path": rel_path}
+
         if file.module_doc:
-            module_docs.append({
-                "file_path": rel_path,
-                "doc": file.module_doc
-            })
-    
-    functions_path = symbols_dir / "functions.json"
-    with open(functions_path, 'w', encoding='utf-8') as f:
-        json.dump(all_functions, f, indent=2, default=str, ensure_ascii=False)
-    
-    classes_path = symbols_dir / "classes.json"
-    with open(classes_path, 'w', encoding='utf-8') as f:
-        json.dump(all_classes, f, indent=2, default=str, ensure_ascii=False)
-    
-    imports_path = symbols_dir / "imports.json"
-    with open(imports_path, 'w', encoding='utf-8') as f:
-        json.dump(all_imports, f, indent=2, default=str, ensure_ascii=False)
-    
-    module_docs_path = symbols_dir / "module_docs.json"
-    with open(module_docs_path, 'w', encoding='utf-8') as f:
-        json.dump(module_docs, f, indent=2, default=str, ensure_ascii=False)
+            yield {"record_type": "module_doc", "file_path": rel_path, "doc": file.module_doc}
 
 
 def generate_summary(dataset: RepositoryDataset) -> dict:
@@ -171,28 +140,33 @@ def generate_summary(dataset: RepositoryDataset) -> dict:
         Dictionary with summary statistics
     """
     from pipeline.metadata_generator import calculate_slice_statistics
-    
+
+    # Single pass over the slices accumulating every counter at once;
+    # the previous per-metric sum() comprehensions re-iterated the slice
+    # list five times.
     total_slices = len(dataset.slices)
-    total_files = sum(slice.metadata.total_files for slice in dataset.slices)
-    total_lines = sum(slice.metadata.total_lines for slice in dataset.slices)
-    target_language_total_files = sum(len(slice.files) for slice in dataset.slices)
-    target_language_total_lines = sum(
-        slice.metadata.target_language_total_lines for slice in dataset.slices
-    )
-    
+    total_files = 0
+    total_lines = 0
+    target_language_total_files = 0
+    target_language_total_lines = 0
     slice_types = {}
     languages = {}
     total_functions = 0
     total_classes = 0
-    
+
     for slice in dataset.slices:
+        total_files += slice.metadata.total_files
+        total_lines += slice.metadata.total_lines
+        target_language_total_files += len(slice.files)
+        target_language_total_lines += slice.metadata.target_language_total_lines
+
         slice_type = slice.slice_type.value
         slice_types[slice_type] = slice_types.get(slice_type, 0) + 1
-        
+
         stats = calculate_slice_statistics(slice)
         total_functions += stats["total_functions"]
         total_classes += stats["total_classes"]
-        
+
         for lang, count in stats["languages"].items():
             languages[lang] = languages.get(lang, 0) + count
     
@@ -11,6 +11,23 @@ from git.exc import InvalidGitRepositoryError
 logger = logging.getLogger(__name__)
 
 
+def _write_commit_graph(repo_path: Path) -> None:
+    """
+    Write the commit-graph file with changed-path Bloom filters.
+
+    A one-time write after clone/update makes every subsequent history
+    walk and path-limited diff in the pipeline read from the serialized
+    graph instead of re-walking loose/packed objects.
+    """
+    try:
+        repo = Repo(str(repo_path))
+        repo.git.commit_graph("write", "--reachable", "--changed-paths")
+        logger.info(f"Wrote commit-graph for repository: {repo_path}")
+    except Exception as e:
+        # Older git versions lack --changed-paths; the pipeline works without it
+        logger.warning(f"Failed to write commit-graph for {repo_path}: {e}")
+
+
 def clone_repository(
     url: str,
     target_dir: str,
@@ -25,7 +42,7 @@ def clone_repository(
         target_dir: Target directory for cloning
         max_retries: Maximum number of retry attempts
         existing_repo_action: Action when target exists.
-            - "update": run git pull and reuse repository
+            - "update": fetch tags/refs from remote and reuse repository
             - "skip": reuse existing repository without updating
             - "ask": prompt user to choose update or skip
         
@@ -73,8 +90,14 @@ def clone_repository(
                 try:
                     repo = Repo(str(target_path))
                     if repo.remotes:
-                        repo.remotes.origin.pull()
+                        # Blob-filtered fetch: refs/tags update without
+                        # downloading file contents; blobs stream in lazily
+                        # when a slice commit is checked out
+                        repo.git.fetch(
+                            "--filter=blob:none", "--tags", "--prune", "origin"
+                        )
                     logger.info(f"Successfully updated repository: {target_path}")
+                    _write_commit_graph(target_path)
                     return str(target_path)
                 except Exception as e:
                     logger.error(f"Failed to update repository on attempt {attempt}: {e}")
@@ -89,9 +112,18 @@ def clone_repository(
     for attempt in range(1, max_retries + 1):
         try:
             logger.info(f"Cloning repository (attempt {attempt}/{max_retries}): {url}")
-            Repo.clone_from(url, str(target_path))
-            
+            # Partial clone: fetch the full commit/tree history but no blobs,
+            # and skip the initial checkout. Blob contents are streamed on
+            # demand when slice commits are checked out into worktrees, so
+            # setup cost no longer scales with repository content size.
+            Repo.clone_from(
+                url,
+                str(target_path),
+                multi_options=["--filter=blob:none", "--no-checkout"]
+            )
+
             logger.info(f"Successfully cloned repository to: {target_path}")
+            _write_commit_graph(target_path)
             return str(target_path)
             
         except GitCommandError as e:
@@ -125,7 +157,11 @@ def validate_repository(repo_path: str) -> bool:
     """
     try:
         repo = Repo(repo_path)
-        if len(list(repo.iter_commits())) == 0:
+        # A single rev-parse answers "is there at least one commit" without
+        # materializing a GitPython Commit object for the whole history
+        try:
+            repo.git.rev_parse("--verify", "--quiet", "HEAD^{commit}")
+        except GitCommandError:
             logger.warning(f"Repository has no commits: {repo_path}")
             return False
         return True
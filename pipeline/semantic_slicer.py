@@ -2,17 +2,19 @@
 
 import logging
 import tempfile
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 from git import Repo
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 from pipeline.models import SemanticSlice, SliceType, SliceMetadata
 from pipeline.config import Config, SlicingConfig
-from pipeline.commit_extractor import (
-    parse_release_tag,
-    get_diff_between_refs
-)
+from pipeline.commit_extractor import parse_release_tag
 from pipeline.slicer.distance_metrics import (
     percentile_rank as _percentile_rank,
     normalize_tag_pair_metrics as _normalize_tag_pair_metrics_impl,
@@ -26,6 +28,30 @@ logger = logging.getLogger(__name__)
 # Cache for parsed API symbols keyed by blob hash
 _api_symbol_cache: Dict[str, Dict[str, Dict[Tuple, Tuple]]] = {}
 
+# Cache of {commit_hash: {path: blob_hash}} built from one `ls-tree -r` pass
+# per commit, so per-file blob lookups never spawn their own git process
+_tree_blob_cache: Dict[str, Dict[str, str]] = {}
+
+# Cache of libgit2 repository handles keyed by working dir; pygit2 reads
+# objects in-process instead of spawning a git subprocess per query
+_pygit2_repo_cache: Dict[str, "pygit2.Repository"] = {}
+
+
+def _get_pygit2_repo(repo: Repo) -> Optional["pygit2.Repository"]:
+    """Return a cached pygit2 handle for *repo*, or None when unavailable."""
+    if pygit2 is None:
+        return None
+    key = str(repo.working_dir)
+    handle = _pygit2_repo_cache.get(key)
+    if handle is None:
+        try:
+            handle = pygit2.Repository(key)
+        except Exception as e:
+            logger.debug(f"pygit2 unavailable for {key}: {e}")
+            return None
+        _pygit2_repo_cache[key] = handle
+    return handle
+
 class TagAnchor(NamedTuple):
     """Lightweight representation of a release-tag anchor point."""
     tag_name: str
@@ -90,16 +116,10 @@ def compare_api_symbols_between_commits(
     try:
         paths: List[str] = []
         if file_paths is None:
-            diff = get_diff_between_refs(repo, old_hash, new_hash)
-            if not diff:
+            paths = _diff_changed_paths(repo, old_hash, new_hash)
+            if not paths:
                 details["skipped_reason"] = "no_diff"
                 return False, details
-            for item in diff:
-                if item.a_path:
-                    paths.append(item.a_path)
-                if item.b_path and item.b_path != item.a_path:
-                    paths.append(item.b_path)
-            paths = list(set(paths))
         else:
             paths = file_paths
         details["changed_files"] = len(paths)
@@ -126,6 +146,37 @@ def compare_api_symbols_between_commits(
         return False, details
 
 
+def _diff_changed_paths(repo: Repo, old_hash: str, new_hash: str) -> List[str]:
+    """
+    List paths changed between two refs via ``git diff --name-status``.
+
+    Unlike a ``create_patch=True`` GitPython diff, this never materializes
+    patch text in memory – only the path list the API comparison needs.
+    Renames/copies contribute both their old and new path.
+    """
+    raw = repo.git.diff("--name-status", "-z", old_hash, new_hash)
+    fields = raw.split("\0")
+
+    paths: List[str] = []
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+        if not status:
+            i += 1
+            continue
+        if status.startswith(("R", "C")) and i + 2 < len(fields):
+            paths.append(fields[i + 1])
+            paths.append(fields[i + 2])
+            i += 3
+        elif i + 1 < len(fields):
+            paths.append(fields[i + 1])
+            i += 2
+        else:
+            break
+
+    return list(set(paths))
+
+
 def _get_public_api_symbols(repo: Repo, commit_hash: str, file_path: str, language: str) -> Dict[str, Dict[Tuple, Tuple]]:
     """
     Extract public API symbols from a file at a specific commit.
@@ -148,14 +199,46 @@ def _get_public_api_symbols(repo: Repo, commit_hash: str, file_path: str, langua
     return symbols
 
 
+def _get_tree_blobs(repo: Repo, commit_hash: str) -> Dict[str, str]:
+    """
+    Return ``{path: blob_hash}`` for every file in a commit's tree.
+
+    Populated once per commit via a single ``git ls-tree -r`` call; the
+    adjacent-tag comparison asks for many files per commit, so this turns
+    one subprocess per file into one per commit.
+    """
+    cached = _tree_blob_cache.get(commit_hash)
+    if cached is not None:
+        return cached
+
+    mapping: Dict[str, str] = {}
+    raw = repo.git.ls_tree("-r", "-z", commit_hash)
+    for entry in raw.split("\0"):
+        if not entry:
+            continue
+        meta, _, path = entry.partition("\t")
+        fields = meta.split()
+        if len(fields) >= 3 and path:
+            mapping[path] = fields[2]
+
+    _tree_blob_cache[commit_hash] = mapping
+    return mapping
+
+
 def _get_blob_hash(repo: Repo, commit_hash: str, file_path: str) -> Optional[str]:
     try:
-        return repo.git.rev_parse(f"{commit_hash}:{file_path}").strip()
+        return _get_tree_blobs(repo, commit_hash).get(file_path)
     except Exception:
         return None
 
 
 def _get_file_content(repo: Repo, commit_hash: str, file_path: str) -> Optional[bytes]:
+    pg_repo = _get_pygit2_repo(repo)
+    if pg_repo is not None:
+        try:
+            return pg_repo.revparse_single(f"{commit_hash}:{file_path}").data
+        except Exception:
+            return None
     try:
         text = repo.git.show(f"{commit_hash}:{file_path}")
         return text.encode("utf-8", errors="ignore")
@@ -289,12 +372,17 @@ def _identify_slices_impl(repo_path: str, config: Config) -> List[SemanticSlice]
 
         seg_lookup = _build_segment_lookup(normalised, anchors, selected_indices)
 
+        commit_stats_by_hash = _preload_commit_stats(
+            repo, [anchors[idx].commit_hash for idx in selected_indices]
+        )
+
         slices: List[SemanticSlice] = []
         for idx in selected_indices:
             anchor = anchors[idx]
             try:
                 slice_obj = _create_slice_from_anchor(
-                    anchor, repo, config, seg_lookup.get(idx)
+                    anchor, repo, config, seg_lookup.get(idx),
+                    commit_stats=commit_stats_by_hash.get(anchor.commit_hash),
                 )
                 if slice_obj:
                     slices.append(slice_obj)
@@ -332,8 +420,20 @@ def collect_tag_anchors(
     """
     raw_anchors: Dict[str, TagAnchor] = {}  # keyed by commit_hash
 
-    for tag_ref in repo.tags:
-        tag_name = tag_ref.name
+    # One `for-each-ref` pass yields every tag with its peeled commit and
+    # committer date; iterating repo.tags instead would instantiate a
+    # GitPython commit object (and its lazy object reads) per tag.
+    raw = repo.git.for_each_ref(
+        "--format=%(refname:short)%1f%(objectname)%1f%(*objectname)"
+        "%1f%(committerdate:unix)%1f%(*committerdate:unix)",
+        "refs/tags",
+    )
+
+    for record in raw.splitlines():
+        fields = record.split("\x1f")
+        if len(fields) != 5:
+            continue
+        tag_name, object_hash, peeled_hash, object_date, peeled_date = fields
 
         version_tuple, status = parse_release_tag(tag_name)
         if version_tuple is None:
@@ -353,15 +453,20 @@ def collect_tag_anchors(
             ),
         }
 
-        try:
-            tag_commit = tag_ref.commit
-        except Exception:
+        # Annotated tags carry the peeled commit in the starred fields;
+        # lightweight tags point at the commit directly.
+        commit_hash = peeled_hash or object_hash
+        date_str = peeled_date or object_date
+        if not commit_hash or not date_str:
             logger.debug(f"Skipping tag {tag_name}: cannot resolve commit")
             continue
 
-        commit_hash = tag_commit.hexsha
-
-        commit_date = tag_commit.committed_datetime
+        try:
+            # Epoch seconds from git avoid per-tag ISO string parsing
+            commit_date = datetime.fromtimestamp(int(date_str), tz=timezone.utc)
+        except (ValueError, OverflowError, OSError):
+            logger.debug(f"Skipping tag {tag_name}: unparseable date {date_str!r}")
+            continue
 
         # SHA de-duplicate: keep the tag with the *highest* version tuple
         existing = raw_anchors.get(commit_hash)
@@ -469,6 +574,18 @@ def _diff_numstat(
     Returns ``(total_lines_changed, file_count)``.
     Binary files (reported as ``-\t-``) are counted as 0 lines.
     """
+    pg_repo = _get_pygit2_repo(repo)
+    if pg_repo is not None:
+        try:
+            diff = pg_repo.diff(old_hash, new_hash)
+            # git diff does rename detection by default; libgit2 does not,
+            # so without this renames inflate the line and file counts
+            diff.find_similar()
+            stats = diff.stats
+            return stats.insertions + stats.deletions, stats.files_changed
+        except Exception as e:
+            logger.debug(f"pygit2 diff failed, falling back to git: {e}")
+
     raw = repo.git.diff("--numstat", old_hash, new_hash)
     if not raw.strip():
         return 0, 0
@@ -517,16 +634,68 @@ def select_tag_slices_dp(
     )
 
 
+def _preload_commit_stats(
+    repo: Repo,
+    commit_hashes: List[str],
+) -> Dict[str, Dict[str, int]]:
+    """
+    Collect per-commit numstats for all given commits in one ``git log`` pass.
+
+    GitPython's ``commit.stats`` spawns one ``git diff`` per commit; a single
+    ``log --no-walk --numstat`` invocation covers every selected anchor at
+    once. Merge commits are diffed against their first parent, matching
+    ``commit.stats`` semantics.
+
+    Returns ``{commit_hash: {"insertions": n, "deletions": n, "files": n}}``.
+    """
+    if not commit_hashes:
+        return {}
+
+    try:
+        raw = repo.git.log(
+            "--no-walk=unsorted", "-m", "--first-parent",
+            "--numstat", "--format=@@%H",
+            *commit_hashes,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Bulk numstat preload failed: {e} – falling back to per-commit stats"
+        )
+        return {}
+
+    stats: Dict[str, Dict[str, int]] = {}
+    current: Optional[Dict[str, int]] = None
+    for line in raw.splitlines():
+        if line.startswith("@@"):
+            current = {"insertions": 0, "deletions": 0, "files": 0}
+            stats[line[2:].strip()] = current
+        elif line.strip() and current is not None:
+            fields = line.split("\t")
+            if len(fields) < 3:
+                continue
+            current["files"] += 1
+            # Binary files are reported as "-"
+            if fields[0] != "-":
+                current["insertions"] += int(fields[0])
+            if fields[1] != "-":
+                current["deletions"] += int(fields[1])
+
+    return stats
+
+
 def _create_slice_from_anchor(
     anchor: TagAnchor,
     repo: Repo,
     config: Config,
     segment_info: Optional[Dict[str, object]] = None,
+    commit_stats: Optional[Dict[str, int]] = None,
 ) -> Optional[SemanticSlice]:
     """
     Build a ``SemanticSlice`` from a tag anchor.
 
-    Constructs the slice directly from tag anchor data.
+    Constructs the slice directly from tag anchor data. ``commit_stats``
+    carries the preloaded numstat for the anchor commit; when absent the
+    per-commit GitPython stats call is used as fallback.
     """
     try:
         repo_name = Path(repo.working_dir).name
@@ -534,7 +703,7 @@ def _create_slice_from_anchor(
         slice_id = f"{repo_name}_{anchor.commit_hash[:8]}_{date_str}"
 
         git_commit = repo.commit(anchor.commit_hash)
-        stats = git_commit.stats.total
+        stats = commit_stats if commit_stats is not None else git_commit.stats.total
         lines_added = stats.get("insertions", 0)
         lines_deleted = stats.get("deletions", 0)
         files_changed = stats.get("files", 0)
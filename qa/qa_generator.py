@@ -20,19 +20,56 @@ def _load_json(path: Path, default: Any) -> Any:
         return json.load(f)
 
 
+def _load_symbol_records(slice_dir: Path) -> Dict[str, List[Dict[str, Any]]] | None:
+    """Bucket a slice's symbols.jsonl records by record_type, or None if absent."""
+    symbols_path = slice_dir / "symbols.jsonl"
+    if not symbols_path.exists():
+        return None
+    buckets: Dict[str, List[Dict[str, Any]]] = {
+        "function": [],
+        "class": [],
+        "import": [],
+        "module_doc": [],
+    }
+    with open(symbols_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            bucket = buckets.get(row.pop("record_type", ""))
+            if bucket is not None:
+                bucket.append(row)
+    return buckets
+
+
 def _load_slice_context(repo_name: str, slice_dir: Path) -> SliceContext:
     metadata = _load_json(slice_dir / "metadata.json", {})
-    symbols_dir = slice_dir / "symbols"
+
+    records = _load_symbol_records(slice_dir)
+    if records is not None:
+        functions = records["function"]
+        classes = records["class"]
+        imports = records["import"]
+        module_docs = records["module_doc"]
+    else:
+        # Legacy layout: one JSON file per symbol kind under symbols/
+        symbols_dir = slice_dir / "symbols"
+        functions = _load_json(symbols_dir / "functions.json", [])
+        classes = _load_json(symbols_dir / "classes.json", [])
+        imports = _load_json(symbols_dir / "imports.json", [])
+        module_docs = _load_json(symbols_dir / "module_docs.json", [])
+
     return SliceContext(
         repo=repo_name,
         slice_id=metadata.get("slice_id") or slice_dir.name,
         version_tag=metadata.get("version_tag"),
         commit_hash=metadata.get("commit_hash") or "",
         commit_date=metadata.get("commit_date") or "",
-        functions=_load_json(symbols_dir / "functions.json", []),
-        classes=_load_json(symbols_dir / "classes.json", []),
-        imports=_load_json(symbols_dir / "imports.json", []),
-        module_docs=_load_json(symbols_dir / "module_docs.json", []),
+        functions=functions,
+        classes=classes,
+        imports=imports,
+        module_docs=module_docs,
     )
 
 